@@ -8,6 +8,10 @@ success() { echo -e "  ${GREEN}✓ $1${NC}"; }
 error() { echo -e "  ${RED}✗ ERROR: $1${NC}"; }
 warn() { echo -e "${YELLOW}$1${NC}"; }
 
+# Last-output timestamp file shared by all run() calls (created on first use,
+# removed by cleanup). Steps run sequentially, so one file is reused throughout.
+RUN_OUTPUT_TIME_FILE=""
+
 # Run a command with output monitoring
 # Shows "(no output for Xs)" indicator when command produces no output for 2+ seconds
 run() {
@@ -17,15 +21,17 @@ run() {
         return $?
     fi
     
-    local output_time_file
-    output_time_file=$(mktemp)
-    local exit_code_file
-    exit_code_file=$(mktemp)
+    if [ -z "$RUN_OUTPUT_TIME_FILE" ]; then
+        RUN_OUTPUT_TIME_FILE=$(mktemp)
+    fi
+    local output_time_file="$RUN_OUTPUT_TIME_FILE"
     local monitor_pid=""
     local cmd_exit_code=0
     
     # Initialize with current time
-    date +%s > "$output_time_file"
+    # $SECONDS is a shell builtin shared by all subshells, so the output loop
+    # can record activity without forking `date` for every line
+    echo "$SECONDS" > "$output_time_file"
     
     # Start background monitor that handles both showing and clearing indicator
     (
@@ -43,13 +49,12 @@ run() {
             last_time=$(cat "$output_time_file" 2>/dev/null || echo "0")
             
             # Validate last_time is a valid number (race condition protection)
-            if ! [[ "$last_time" =~ ^[0-9]+$ ]]; then
-                continue
-            fi
+            # Plain pattern match - no need for the regex engine on a digit check
+            case "$last_time" in
+                ''|*[!0-9]*) continue ;;
+            esac
             
-            local now
-            now=$(date +%s)
-            local elapsed=$((now - last_time))
+            local elapsed=$((SECONDS - last_time))
             
             # Skip unreasonable values (race condition protection)
             if [ $elapsed -lt 0 ] || [ $elapsed -gt 10000 ]; then
@@ -79,17 +84,21 @@ run() {
     monitor_pid=$!
     
     # Run command with output processing
-    # Pipe through while loop to update timestamp on each line
+    # Pipe through while loop to update timestamp on output; the file is only
+    # rewritten when the second changes, not for every line of a noisy command
+    local last_mark=$SECONDS
     "$@" 2>&1 | while IFS= read -r line; do
         echo "$line"
-        date +%s > "$output_time_file"
+        if [ $SECONDS -ne $last_mark ]; then
+            last_mark=$SECONDS
+            echo "$last_mark" > "$output_time_file"
+        fi
     done
     
     # Capture exit code from the original command (PIPESTATUS[0])
     cmd_exit_code=${PIPESTATUS[0]}
     
-    # Stop monitor
-    rm -f "$output_time_file"
+    # Stop monitor (the timestamp file is kept for the next run)
     if [ -n "$monitor_pid" ] && kill -0 "$monitor_pid" 2>/dev/null; then
         kill "$monitor_pid" 2>/dev/null
         wait "$monitor_pid" 2>/dev/null || true
@@ -98,7 +107,6 @@ run() {
     # Final indicator clear (in case monitor didn't catch it)
     clear_no_output_indicator 2>/dev/null || true
     
-    rm -f "$exit_code_file"
     return $cmd_exit_code
 }
 
@@ -114,6 +122,9 @@ notarytool() {
 cleanup() {
     local exit_code=$?
     
+    # Remove run() timestamp file (also stops a monitor that is still running)
+    [ -n "$RUN_OUTPUT_TIME_FILE" ] && rm -f "$RUN_OUTPUT_TIME_FILE"
+    
     # Mark current step as failed if we're exiting with error
     if [ $exit_code -ne 0 ] && [ $CURRENT_STEP -gt 0 ]; then
         STEP_STATUSES[$((CURRENT_STEP - 1))]="fail"
@@ -139,7 +139,7 @@ if [ "$BUILD_TYPE" = "rebuild-dmg" ]; then
         
         # Check if it was signed with the correct identity
         EXISTING_CODESIGN=$(codesign -dv --verbose=4 "$APP_PATH" 2>&1)
-        EXISTING_AUTHORITY=$(echo "$EXISTING_CODESIGN" | grep "Authority=" | head -1 | sed 's/Authority=//')
+        EXISTING_AUTHORITY=$(echo "$EXISTING_CODESIGN" | awk 'sub(/Authority=/, "") { print; exit }')
         if [[ "$EXISTING_AUTHORITY" != *"$DEVELOPER_NAME"* ]]; then
             echo -e "${RED}Error: Existing build was signed with wrong identity${NC}"
             info "Found: $EXISTING_AUTHORITY"
@@ -149,7 +149,7 @@ if [ "$BUILD_TYPE" = "rebuild-dmg" ]; then
         fi
         
         # Check for hardened runtime (required for notarization)
-        if ! echo "$EXISTING_CODESIGN" | grep -q "flags=.*runtime"; then
+        if ! echo "$EXISTING_CODESIGN" | LC_ALL=C grep -q "flags=.*runtime"; then
             echo -e "${RED}Error: Existing build does not have hardened runtime enabled${NC}"
             info "This is required for notarization."
             info "Run with --dmg --signed instead to perform a full signed build."
@@ -197,22 +197,23 @@ if [ "$BUILD_TYPE" != "rebuild-dmg" ]; then
         --no-open
     step_check "Failed to convert to Xcode project"
 
-    # Fix bundle identifier (converter derives from app name, ignoring our setting)
-    info "Fixing bundle identifiers..."
-    PBXPROJ="$XCODE_DIR/$APP_NAME/$APP_NAME.xcodeproj/project.pbxproj"
-    sed -i '' 's/com\.getstreamkeys\.Stream-Keys/com.getstreamkeys.StreamKeys/g' "$PBXPROJ"
-
     # Copy entitlements files to the Xcode project
     info "Copying entitlements files..."
     cp "$SCRIPT_DIR/entitlements/app.entitlements" "$XCODE_DIR/$APP_NAME/macOS (App)/App.entitlements"
     cp "$SCRIPT_DIR/entitlements/extension.entitlements" "$XCODE_DIR/$APP_NAME/macOS (Extension)/Extension.entitlements"
 
-    # Configure entitlements in project.pbxproj (use INFOPLIST_FILE as anchor - always present)
-    info "Configuring entitlements in Xcode project..."
-    # Add CODE_SIGN_ENTITLEMENTS for macOS App target
-    sed -i '' 's/INFOPLIST_FILE = "macOS (App)\/Info.plist";/CODE_SIGN_ENTITLEMENTS = "macOS (App)\/App.entitlements";\n\t\t\t\tINFOPLIST_FILE = "macOS (App)\/Info.plist";/g' "$PBXPROJ"
-    # Add CODE_SIGN_ENTITLEMENTS for macOS Extension target
-    sed -i '' 's/INFOPLIST_FILE = "macOS (Extension)\/Info.plist";/CODE_SIGN_ENTITLEMENTS = "macOS (Extension)\/Extension.entitlements";\n\t\t\t\tINFOPLIST_FILE = "macOS (Extension)\/Info.plist";/g' "$PBXPROJ"
+    # Patch project.pbxproj in a single pass over the file
+    # (C locale: patterns are ASCII-only, so skip multibyte decoding of the file)
+    info "Fixing bundle identifiers and configuring entitlements in Xcode project..."
+    PBXPROJ="$XCODE_DIR/$APP_NAME/$APP_NAME.xcodeproj/project.pbxproj"
+    # 1. Fix bundle identifier (converter derives from app name, ignoring our setting)
+    # 2. Add CODE_SIGN_ENTITLEMENTS for macOS App target (INFOPLIST_FILE as anchor - always present)
+    # 3. Add CODE_SIGN_ENTITLEMENTS for macOS Extension target
+    LC_ALL=C sed -i '' \
+        -e 's/com\.getstreamkeys\.Stream-Keys/com.getstreamkeys.StreamKeys/g' \
+        -e 's/INFOPLIST_FILE = "macOS (App)\/Info.plist";/CODE_SIGN_ENTITLEMENTS = "macOS (App)\/App.entitlements";\n\t\t\t\tINFOPLIST_FILE = "macOS (App)\/Info.plist";/g' \
+        -e 's/INFOPLIST_FILE = "macOS (Extension)\/Info.plist";/CODE_SIGN_ENTITLEMENTS = "macOS (Extension)\/Extension.entitlements";\n\t\t\t\tINFOPLIST_FILE = "macOS (Extension)\/Info.plist";/g' \
+        "$PBXPROJ"
 
     # Step 3: Build with Xcode
     step "Building app with Xcode ($CODE_SIGN_IDENTITY)..."
@@ -247,7 +248,7 @@ if [ "$BUILD_TYPE" != "rebuild-dmg" ]; then
         CODESIGN_INFO=$(codesign -dv --verbose=4 "$APP_PATH" 2>&1)
 
         info "  Checking signing identity..."
-        SIGNING_AUTHORITY=$(echo "$CODESIGN_INFO" | grep "Authority=" | head -1 | sed 's/Authority=//')
+        SIGNING_AUTHORITY=$(echo "$CODESIGN_INFO" | awk 'sub(/Authority=/, "") { print; exit }')
         if [[ "$SIGNING_AUTHORITY" == *"$DEVELOPER_NAME"* ]]; then
             success "Signed by $SIGNING_AUTHORITY"
         else
@@ -256,7 +257,7 @@ if [ "$BUILD_TYPE" != "rebuild-dmg" ]; then
         fi
 
         info "  Checking for hardened runtime and timestamp..."
-        if echo "$CODESIGN_INFO" | grep -q "flags=.*runtime"; then
+        if echo "$CODESIGN_INFO" | LC_ALL=C grep -q "flags=.*runtime"; then
             success "Hardened runtime enabled"
         else
             error "Hardened runtime not enabled"
@@ -303,7 +304,7 @@ if [ "$BUILD_TYPE" = "dmg" ] || [ "$BUILD_TYPE" = "rebuild-dmg" ]; then
         echo "$NOTARY_OUTPUT"
         step_check "Notarization failed"
 
-        SUBMISSION_ID=$(echo "$NOTARY_OUTPUT" | grep -E "^\s*id:" | head -1 | awk '{print $2}')
+        SUBMISSION_ID=$(echo "$NOTARY_OUTPUT" | awk '/^[[:space:]]*id:/ { print $2; exit }')
 
         step "Stapling notarization ticket..."
         MAX_RETRIES=5
@@ -311,7 +312,7 @@ if [ "$BUILD_TYPE" = "dmg" ] || [ "$BUILD_TYPE" = "rebuild-dmg" ]; then
         info "Waiting ${RETRY_DELAY}s for notarization ticket to propagate..."
         sleep $RETRY_DELAY
         
-        for i in $(seq 1 $MAX_RETRIES); do
+        for ((i=1; i<=MAX_RETRIES; i++)); do
             if xcrun stapler staple "$OUTPUT_PATH" 2>/dev/null; then
                 success "Stapling successful!"
                 step_check
@@ -24,10 +24,22 @@ fi
 HEADER_LINES=0
 OUTPUT_START_LINE=0
 
+# Cached terminal control sequences (filled in by init_display)
+# Header updates run on every step change and every second of the no-output
+# indicator, so look each sequence up once instead of forking tput each time
+TPUT_SAVE_CURSOR=""
+TPUT_RESTORE_CURSOR=""
+TPUT_REGION_FULL=""
+TPUT_REGION_OUTPUT=""
+
 # Column widths (fixed)
 COL_STATUS_WIDTH=11   # " [RUNNING] "
 COL_STEP_WIDTH=7      # " [1/7] "
 
+# Details column widths (derived from TERM_WIDTH once in init_display)
+DETAILS_WIDTH=$((TERM_WIDTH - COL_STATUS_WIDTH - COL_STEP_WIDTH - 4))
+DETAILS_TEXT_WIDTH=$((DETAILS_WIDTH - 2))
+
 # =============================================================================
 # Terminal Size Detection
 # =============================================================================
@@ -36,8 +48,8 @@ detect_terminal_size() {
     if command -v stty &>/dev/null; then
         local size=$(stty size 2>/dev/null)
         if [ -n "$size" ]; then
-            TERM_HEIGHT=$(echo "$size" | cut -d' ' -f1)
-            TERM_WIDTH=$(echo "$size" | cut -d' ' -f2)
+            # "rows cols" - split with the read builtin instead of echo | cut
+            read -r TERM_HEIGHT TERM_WIDTH <<< "$size"
             return
         fi
     fi
@@ -56,19 +68,26 @@ detect_terminal_size() {
 # Drawing Primitives
 # =============================================================================
 
+# Repeat a character N times into a variable (works with multi-byte box chars)
+# Usage: repeat_char <var_name> <char> <count>
+repeat_char() {
+    local _padding
+    printf -v _padding '%*s' "$3" ''
+    printf -v "$1" '%s' "${_padding// /$2}"
+}
+
 # Draw a horizontal line without columns (for title area)
 draw_hline() {
     local row=$1
     local left_char="$2"
     local fill_char="$3"
     local right_char="$4"
+    local fill
+    
+    repeat_char fill "$fill_char" $((TERM_WIDTH - 2))
     
     tput cup $row 0
-    printf "%s" "$left_char"
-    for ((i=1; i<TERM_WIDTH-1; i++)); do
-        printf "%s" "$fill_char"
-    done
-    printf "%s" "$right_char"
+    printf "%s%s%s" "$left_char" "$fill" "$right_char"
 }
 
 # Draw a horizontal line with column separators
@@ -78,26 +97,19 @@ draw_hline_cols() {
     local fill_char="$3"
     local col_char="$4"
     local right_char="$5"
+    local status_fill step_fill details_fill
     
-    local details_width=$((TERM_WIDTH - COL_STATUS_WIDTH - COL_STEP_WIDTH - 4))
+    repeat_char status_fill "$fill_char" $COL_STATUS_WIDTH
+    repeat_char step_fill "$fill_char" $COL_STEP_WIDTH
+    repeat_char details_fill "$fill_char" $DETAILS_WIDTH
     
+    # Write the whole line at once: status, step and details columns
     tput cup $row 0
-    printf "%s" "$left_char"
-    # Status column
-    for ((i=0; i<COL_STATUS_WIDTH; i++)); do
-        printf "%s" "$fill_char"
-    done
-    printf "%s" "$col_char"
-    # Step column
-    for ((i=0; i<COL_STEP_WIDTH; i++)); do
-        printf "%s" "$fill_char"
-    done
-    printf "%s" "$col_char"
-    # Details column
-    for ((i=0; i<details_width; i++)); do
-        printf "%s" "$fill_char"
-    done
-    printf "%s" "$right_char"
+    printf "%s%s%s%s%s%s%s" \
+        "$left_char" \
+        "$status_fill" "$col_char" \
+        "$step_fill" "$col_char" \
+        "$details_fill" "$right_char"
 }
 
 draw_row_lr() {
@@ -109,9 +121,7 @@ draw_row_lr() {
     local space=$((TERM_WIDTH - 4 - left_len - right_len))
     
     tput cup $row 0
-    printf "║ %s" "$left"
-    printf "%${space}s" ""
-    printf "%s ║" "$right"
+    printf "║ %s%*s%s ║" "$left" "$space" "" "$right"
 }
 
 # =============================================================================
@@ -122,6 +132,8 @@ init_display() {
     [ "$IS_TTY" = false ] && return
     
     detect_terminal_size
+    DETAILS_WIDTH=$((TERM_WIDTH - COL_STATUS_WIDTH - COL_STEP_WIDTH - 4))
+    DETAILS_TEXT_WIDTH=$((DETAILS_WIDTH - 2))
     
     # Header structure:
     # Row 0: Top border
@@ -140,6 +152,11 @@ init_display() {
         return
     fi
     
+    TPUT_SAVE_CURSOR=$(tput sc)
+    TPUT_RESTORE_CURSOR=$(tput rc)
+    TPUT_REGION_FULL=$(tput csr 0 $((TERM_HEIGHT - 1)))
+    TPUT_REGION_OUTPUT=$(tput csr $OUTPUT_START_LINE $((TERM_HEIGHT - 1)))
+    
     tput civis 2>/dev/null || true
     tput clear
     
@@ -147,13 +164,11 @@ init_display() {
     
     # Set scrolling region: output area only (below header)
     # This keeps the header fixed while output scrolls
-    tput csr $OUTPUT_START_LINE $((TERM_HEIGHT - 1))
+    printf "%s" "$TPUT_REGION_OUTPUT"
     tput cup $OUTPUT_START_LINE 0
 }
 
 draw_header() {
-    local details_width=$((TERM_WIDTH - COL_STATUS_WIDTH - COL_STEP_WIDTH - 4))
-    
     # Row 0: Top border (no columns yet)
     draw_hline 0 "╔" "═" "╗"
     
@@ -169,13 +184,13 @@ draw_header() {
     printf "║ %b%-9s%b ║ %b%-5s%b ║ %b%-*s%b ║" \
         "$BOLD" "Status" "$NC" \
         "$BOLD" "Step" "$NC" \
-        "$BOLD" "$((details_width - 2))" "Details" "$NC"
+        "$BOLD" "$DETAILS_TEXT_WIDTH" "Details" "$NC"
     
     # Row 4: Header separator
     draw_hline_cols 4 "╠" "═" "╬" "╣"
     
     # Step rows (starting at row 5)
-    for i in $(seq 0 $((TOTAL_STEPS - 1))); do
+    for ((i=0; i<TOTAL_STEPS; i++)); do
         draw_step_line $((i + 5)) $i "pending"
     done
     
@@ -201,13 +216,12 @@ draw_step_line() {
     esac
     
     local step_text="[$step_num/$TOTAL_STEPS]"
-    local details_width=$((TERM_WIDTH - COL_STATUS_WIDTH - COL_STEP_WIDTH - 4))
     
     tput cup $row 0
     printf "║ %b%-9s%b ║ %-5s ║ %-*s ║" \
         "$status_color" "$status_text" "$NC" \
         "$step_text" \
-        "$((details_width - 2))" "$name"
+        "$DETAILS_TEXT_WIDTH" "$name"
 }
 
 update_step_status() {
@@ -216,26 +230,26 @@ update_step_status() {
     [ "$IS_TTY" = false ] && return
     
     # Save cursor position
-    tput sc
+    printf "%s" "$TPUT_SAVE_CURSOR"
     
     # Temporarily reset scrolling region to access header
-    tput csr 0 $((TERM_HEIGHT - 1))
+    printf "%s" "$TPUT_REGION_FULL"
     
     # Update the step line (step rows start at row 5)
     draw_step_line $((step_idx + 5)) $step_idx "$status"
     
     # Restore scrolling region
-    tput csr $OUTPUT_START_LINE $((TERM_HEIGHT - 1))
+    printf "%s" "$TPUT_REGION_OUTPUT"
     
     # Restore cursor position
-    tput rc
+    printf "%s" "$TPUT_RESTORE_CURSOR"
 }
 
 cleanup_display() {
     [ "$IS_TTY" = false ] && return
     
     # Reset scrolling region to full screen
-    tput csr 0 $((TERM_HEIGHT - 1))
+    printf "%s" "$TPUT_REGION_FULL"
     tput cnorm 2>/dev/null || true
     tput cup $((TERM_HEIGHT - 1)) 0
     echo ""
@@ -268,33 +282,31 @@ update_no_output_indicator() {
     local status_color="$YELLOW"
     
     local step_text="[$step_num/$TOTAL_STEPS]"
-    local details_width=$((TERM_WIDTH - COL_STATUS_WIDTH - COL_STEP_WIDTH - 4))
     local name_with_indicator="${name}${indicator}"
     
     # Truncate if too long
-    local max_name_len=$((details_width - 2))
-    if [ ${#name_with_indicator} -gt $max_name_len ]; then
-        name_with_indicator="${name_with_indicator:0:$((max_name_len - 3))}..."
+    if [ ${#name_with_indicator} -gt $DETAILS_TEXT_WIDTH ]; then
+        name_with_indicator="${name_with_indicator:0:$((DETAILS_TEXT_WIDTH - 3))}..."
     fi
     
     # Save cursor position
-    tput sc
+    printf "%s" "$TPUT_SAVE_CURSOR"
     
     # Temporarily reset scrolling region to access header
-    tput csr 0 $((TERM_HEIGHT - 1))
+    printf "%s" "$TPUT_REGION_FULL"
     
     # Draw the step line with indicator
     tput cup $row 0
     printf "║ %b%-9s%b ║ %-5s ║ %b%-*s%b ║" \
         "$status_color" "$status_text" "$NC" \
         "$step_text" \
-        "$DIM" "$((details_width - 2))" "$name_with_indicator" "$NC"
+        "$DIM" "$DETAILS_TEXT_WIDTH" "$name_with_indicator" "$NC"
     
     # Restore scrolling region
-    tput csr $OUTPUT_START_LINE $((TERM_HEIGHT - 1))
+    printf "%s" "$TPUT_REGION_OUTPUT"
     
     # Restore cursor position
-    tput rc
+    printf "%s" "$TPUT_RESTORE_CURSOR"
 }
 
 # Clear the no-output indicator by redrawing the step line normally
@@ -304,19 +316,19 @@ clear_no_output_indicator() {
     local step_idx=$((CURRENT_STEP - 1))
     
     # Save cursor position
-    tput sc
+    printf "%s" "$TPUT_SAVE_CURSOR"
     
     # Temporarily reset scrolling region to access header
-    tput csr 0 $((TERM_HEIGHT - 1))
+    printf "%s" "$TPUT_REGION_FULL"
     
     # Redraw step line without indicator
     draw_step_line $((step_idx + 5)) $step_idx "running"
     
     # Restore scrolling region
-    tput csr $OUTPUT_START_LINE $((TERM_HEIGHT - 1))
+    printf "%s" "$TPUT_REGION_OUTPUT"
     
     # Restore cursor position
-    tput rc
+    printf "%s" "$TPUT_RESTORE_CURSOR"
 }
 
 # =============================================================================